@@ -53,21 +53,18 @@ def use_chen_and_kipping_to_estimate_radius_from_mass(M):
     S["stellar"] = 0.881
     C["stellar"] = -2.85
 
-    # create an empty array of radii
-    original_shape = np.shape(M)
-    logM = np.atleast_1d(np.log10(M.to_value(Mearth)))
-    logR = np.zeros(np.shape(logM)) * np.nan
+    # find which range each planet falls in, all at once
+    # (anything beyond the last maximum, or nan, gets nan coefficients)
+    regimes = ["terran", "neptunian", "jovian", "stellar"]
+    edges = [M_max[this].to_value(Mearth) for this in regimes]
+    slopes = np.array([S[this] for this in regimes] + [np.nan])
+    intercepts = np.array([C[this] for this in regimes] + [np.nan])
+    m = M.to_value(Mearth)
+    which = np.searchsorted(edges, m, side="right")
 
-    # work our way down in mass, updating radii as we go
-    for this in ["stellar", "jovian", "neptunian", "terran"]:
-        # which planets are below this maximum?
-        x = M < M_max[this]
-
-        # calculate the radius
-        logR[x] = C[this] + logM[x] * S[this]
-
-    # return the same shape
-    return 10 ** logR.reshape(original_shape) * Rearth
+    # calculate the radius
+    logR = intercepts[which] + np.log10(m) * slopes[which]
+    return 10**logR * Rearth
 
 
 def use_chen_and_kipping_to_estimate_mass_from_radius(R):
@@ -95,21 +92,18 @@ def use_chen_and_kipping_to_estimate_mass_from_radius(R):
     S["neptunian"] = 0.589
     C["neptunian"] = -0.0925
 
-    # create an empty array of radii
-    original_shape = np.shape(R)
-    logR = np.atleast_1d(np.log10(R.to_value(Rearth)))
-    logM = np.zeros(np.shape(logR)) * np.nan
-
-    # work our way down in mass, updating radii as we go
-    for this in ["neptunian", "terran"]:
-        # which planets are below this maximum?
-        x = R < R_max[this]
-
-        # calculate the radius
-        logM[x] = (logR[x] - C[this]) / S[this]
-
-    # return the same shape
-    return 10 ** logM.reshape(original_shape) * Mearth
+    # find which range each planet falls in, all at once
+    # (anything beyond the last maximum, or nan, gets nan coefficients)
+    regimes = ["terran", "neptunian"]
+    edges = [R_max[this].to_value(Rearth) for this in regimes]
+    slopes = np.array([S[this] for this in regimes] + [np.nan])
+    intercepts = np.array([C[this] for this in regimes] + [np.nan])
+    r = R.to_value(Rearth)
+    which = np.searchsorted(edges, r, side="right")
+
+    # calculate the mass
+    logM = (np.log10(r) - intercepts[which]) / slopes[which]
+    return 10**logM * Mearth
 
 
 def plot_chen(independent="mass", **kw):
@@ -0,0 +1,77 @@
+import copy
+from functools import wraps
+
+# keywords that make a calculation do something besides return values
+_keywords_with_side_effects = ["visualize"]
+
+# (this goes up whenever calculations change for a whole class
+# of populations, making everyone's remembered values stale)
+_generation = 0
+
+
+def forget_all_calculations():
+    """
+    Make every population forget its remembered calculations.
+
+    Adding or replacing a calculation changes it for all
+    populations of a class (and for anything calculated
+    from it), not just for the population it was added to.
+    """
+    global _generation
+    _generation += 1
+
+
+def cache_calculation(function):
+    """
+    Remember the values of a calculation after it's first done.
+
+    Some derived quantities (like semimajor axis or equilibrium
+    temperature) are calculated over and over again, because lots
+    of other calculations depend on them. This decorator stores the
+    simple array of values for a population the first time it is
+    calculated, so later calls can reuse it. Distributions are
+    never cached, because they are random samples, and neither
+    are calls that ask for side effects like `visualize=True`.
+    Every call gets its own copy of the values, so modifying
+    them won't change what later calls return.
+
+    The cache is stored inside the population and cleared by
+    `Population._invalidate_cache()`, which happens automatically
+    whenever the `.standard` table gets replaced or updated via
+    `.add_column`, `.update_values`, or `.sort`. If you modify
+    the `.standard` table directly, please call it yourself!
+
+    Parameters
+    ----------
+    function : function
+        A calculation that looks like `f(self, distribution=False, **kw)`.
+
+    Returns
+    -------
+    cached : function
+        The same calculation, but remembering its values.
+    """
+
+    @wraps(function)
+    def cached(self, *args, **kw):
+        distribution = args[0] if args else kw.get("distribution", False)
+        if distribution or any(kw.get(k) for k in _keywords_with_side_effects):
+            return function(self, *args, **kw)
+
+        # (start over if the cache predates a change to any calculations)
+        if self.__dict__.get("_calculation_generation") != _generation:
+            self.__dict__["_calculation_cache"] = {}
+            self.__dict__["_calculation_generation"] = _generation
+        cache = self.__dict__.setdefault("_calculation_cache", {})
+
+        key = (function.__name__, args, tuple(sorted(kw.items())))
+        try:
+            return copy.copy(cache[key])
+        except KeyError:
+            cache[key] = function(self, *args, **kw)
+            return copy.copy(cache[key])
+        except TypeError:
+            # (keywords that can't be hashed, like arrays, skip the cache)
+            return function(self, *args, **kw)
+
+    return cached
@@ -1,5 +1,85 @@
 from ...imports import *
 from ...models.chen import *
+from .caching import cache_calculation
+
+# a numerical constant that shows up often
+_four_pi = 4 * np.pi
+
+# physical constants as plain floats, in the units the calculations need
+_G_in_AU3_per_Msun_day2 = con.G.to_value("AU**3/(Msun*day**2)")
+_G_in_m3_per_kg_s2 = con.G.to_value("m**3/(kg*s**2)")
+_G_in_km3_per_kg_s2 = con.G.to_value("km**3/(kg*s**2)")
+_sigma_sb_in_W_per_m2_K4 = con.sigma_sb.to_value("W/(m**2*K**4)")
+
+# combinations of physical constants, for the atmosphere calculations
+_G_m_p_over_k_B = (con.G * con.m_p / con.k_B).to_value("K*m/kg")
+_k_B_over_m_p = (con.k_B / con.m_p).to_value("km**2/(s**2*K)")
+
+
+def _strip_unit(x, unit):
+    """
+    Get plain values (or a distribution of them) in a particular unit.
+
+    This works whether `x` is a Quantity or a simple array, which
+    is helpful because some dimensionless quantities come out of
+    the standardized table without any units attached.
+
+    Parameters
+    ----------
+    x : array, astropy.units.Quantity, astropy.uncertainty.Distribution
+        The values to convert.
+    unit : str, astropy.units.Unit
+        The unit in which the values should be expressed.
+
+    Returns
+    -------
+    values : array, astropy.uncertainty.Distribution
+        The values, with no units attached.
+    """
+    return u.Quantity(x, unit, copy=False).to_value(unit)
+
+
+def _impact_parameter_from_orbit(a_over_Rs, i, e, omega):
+    """
+    Calculate the transit impact parameter from plain orbital values.
+
+    Parameters
+    ----------
+    a_over_Rs : array
+        Scaled semimajor axis, a/R*.
+    i : array
+        Orbital inclination, in radians.
+    e : array
+        Orbital eccentricity.
+    omega : array
+        Argument of periastron, in radians.
+    """
+    return a_over_Rs * np.cos(i) * ((1 - e**2) / (1 + e * np.sin(omega)))
+
+
+def _transit_duration_from_orbit(P, a_over_Rs, k, b, e, omega):
+    """
+    Calculate the total transit duration from plain orbital values.
+
+    Parameters
+    ----------
+    P : array
+        Orbital period, in days.
+    a_over_Rs : array
+        Scaled semimajor axis, a/R*.
+    k : array
+        Scaled planet radius, Rp/R*.
+    b : array
+        Transit impact parameter.
+    e : array
+        Orbital eccentricity.
+    omega : array
+        Argument of periastron, in radians.
+    """
+    T0 = P / np.pi / a_over_Rs
+    T = T0 * np.sqrt((1 + k**2) - b**2)
+    factor = np.sqrt(1 - e**2) / (1 + e * np.sin(omega))
+    return T * factor
 
 
 def semimajoraxis_from_period(self, distribution=False, **kw):
@@ -17,11 +97,10 @@ def semimajoraxis_from_period(self, distribution=False, **kw):
         If True, return an astropy.uncertainty.Distribution,
         which can be used for error propagation.
     """
-    P = self.get("period", distribution=distribution)
-    M = self.get("stellar_mass", distribution=distribution)
-    G = con.G
-    a = ((G * M * P**2 / 4 / np.pi**2) ** (1 / 3)).to("AU")
-    return a
+    P = self.get("period", distribution=distribution).to_value("day")
+    M = self.get("stellar_mass", distribution=distribution).to_value("Msun")
+    a = np.cbrt(_G_in_AU3_per_Msun_day2 / (_four_pi * np.pi) * M * P**2)
+    return u.Quantity(a, "AU", copy=False)
 
 
 def semimajoraxis_from_transit_scaled_semimajoraxis(self, distribution=False, **kw):
@@ -45,6 +124,7 @@ def semimajoraxis_from_transit_scaled_semimajoraxis(self, distribution=False, **
     return a
 
 
+@cache_calculation
 def semimajoraxis(self, distribution=False, **kw):
     """
     Planet Semi-major Axis (a, AU)
@@ -91,6 +171,7 @@ def scaled_semimajoraxis_from_semimajoraxis(self, distribution=False, **kw):
     return (a / R).decompose()
 
 
+@cache_calculation
 def scaled_semimajoraxis(self, distribution=False, **kw):
     """
     Planet Scaled Semi-major Axis (a/R*, unitless)
@@ -116,6 +197,7 @@ def scaled_semimajoraxis(self, distribution=False, **kw):
     return a_over_Rs
 
 
+@cache_calculation
 def eccentricity(self, distribution=False, **kw):
     """
     Planet Orbital Eccentricity (e, unitless)
@@ -135,16 +217,18 @@ def eccentricity(self, distribution=False, **kw):
     # pull out the actual values from the table
     e = self.get_values_from_table("eccentricity", distribution=distribution)
 
-    # replace nans with 0
+    # replace nans with 0 (if there are any)
     if distribution == False:
-        bad = np.isfinite(e) == False
-        e[bad] = 0
+        bad = ~np.isfinite(e)
+        if np.any(bad):
+            e[bad] = 0
     # (by not doing anything to replace nan values with 0 if `distribution==True`,
     # planets missing original values will end up with `nan` uncertainties)
 
     return e
 
 
+@cache_calculation
 def argument_of_periastron(self, distribution=False, **kw):
     """
     Planet Orbital Argument of Periastron ($\omega$, degrees)
@@ -163,10 +247,11 @@ def argument_of_periastron(self, distribution=False, **kw):
     # pull out the actual values from the table
     argument_of_periastron = self.standard["argument_of_periastron"].copy()
 
-    # replace nans with 0
+    # replace nans with 0 (if there are any)
     if distribution == False:
-        bad = np.isfinite(argument_of_periastron) == False
-        argument_of_periastron[bad] = 0 * u.deg
+        bad = ~np.isfinite(self._peek_column("argument_of_periastron"))
+        if np.any(bad):
+            argument_of_periastron[bad] = 0 * u.deg
     # (by not doing anything to replace nan values with 0 if `distribution==True`,
     # planets missing original values will end up with `nan` uncertainties)
 
@@ -190,14 +275,14 @@ def transit_impact_parameter_from_inclination(self, distribution=False, **kw):
         which can be used for error propagation.
     """
     # extract necessary quantities
-    a_over_Rs = self.scaled_semimajoraxis(distribution=distribution)
-    i = self.inclination(distribution=distribution)
-    e = self.eccentricity(distribution=distribution)
-    omega = self.argument_of_periastron(distribution=distribution)
+    a_over_Rs = _strip_unit(self.scaled_semimajoraxis(distribution=distribution), "")
+    i = _strip_unit(self.inclination(distribution=distribution), "rad")
+    e = _strip_unit(self.eccentricity(distribution=distribution), "")
+    omega = _strip_unit(self.argument_of_periastron(distribution=distribution), "rad")
 
     # calculate impact parameter based on instantaneous distance at transit
-    b = a_over_Rs * np.cos(i) * ((1 - e**2) / (1 + e * np.sin(omega)))
-    return b
+    b = _impact_parameter_from_orbit(a_over_Rs, i, e, omega)
+    return u.Quantity(b, "", copy=False)
 
 
 def transit_impact_parameter(self, distribution=False, **kw):
@@ -227,8 +312,10 @@ def transit_impact_parameter(self, distribution=False, **kw):
 
 # the 1360 W/m^2 that Earth receives from the Sun
 earth_insolation = (1 * u.Lsun / 4 / np.pi / u.AU**2).to(u.W / u.m**2)
+_earth_insolation_in_W_per_m2 = earth_insolation.to_value(u.W / u.m**2)
 
 
+@cache_calculation
 def insolation(self, distribution=False, **kw):
     """
     Planet Insolation (S, W/m**2)
@@ -247,10 +334,13 @@ def insolation(self, distribution=False, **kw):
     """
 
     # calculate the average insolation the planet receives
-    L = self.stellar_luminosity(distribution=distribution)
-    a = self.semimajoraxis(distribution=distribution)
-    S = L / 4 / np.pi / a**2
-    return S.to(u.W / u.m**2)
+    L = self.stellar_luminosity(distribution=distribution).to_value("W")
+    a = self.semimajoraxis(distribution=distribution).to_value("m")
+
+    # (L and a may be a mix of simple arrays and distributions,
+    # so let numpy broadcast them rather than writing in place)
+    S = L / (_four_pi * a * a)
+    return u.Quantity(S, "W/m**2", copy=False)
 
 
 def relative_insolation(self, distribution=False, **kw):
@@ -268,7 +358,8 @@ def relative_insolation(self, distribution=False, **kw):
         If True, return an astropy.uncertainty.Distribution,
         which can be used for error propagation.
     """
-    return self.insolation(distribution=distribution) / earth_insolation
+    S = self.insolation(distribution=distribution).to_value("W/m**2")
+    return u.Quantity(S / _earth_insolation_in_W_per_m2, "", copy=False)
 
 
 def log_relative_insolation(self, distribution=False, **kw):
@@ -286,7 +377,8 @@ def log_relative_insolation(self, distribution=False, **kw):
         If True, return an astropy.uncertainty.Distribution,
         which can be used for error propagation.
     """
-    return np.log10(self.relative_insolation(distribution=distribution))
+    relative = self.relative_insolation(distribution=distribution).to_value("")
+    return u.Quantity(np.log10(relative), "", copy=False)
 
 
 def relative_cumulative_xuv_insolation(self, distribution=False, **kw):
@@ -312,6 +404,7 @@ def relative_cumulative_xuv_insolation(self, distribution=False, **kw):
     return self.relative_insolation(distribution=distribution) * xuv_proxy
 
 
+@cache_calculation
 def teq(self, distribution=False, albedo=0, f=1 / 4, **kw):
     """
     Planet Equilibrium Temperature (K)
@@ -348,10 +441,9 @@ def teq(self, distribution=False, albedo=0, f=1 / 4, **kw):
         If True, return an astropy.uncertainty.Distribution,
         which can be used for error propagation.
     """
-    S = self.insolation(distribution=distribution)
-    sigma = con.sigma_sb
-    teq = ((S * f * (1 - albedo) / sigma) ** (1 / 4)).to(u.K)
-    return teq
+    S = self.insolation(distribution=distribution).to_value("W/m**2")
+    teq = np.sqrt(np.sqrt(S * (f * (1 - albedo) / _sigma_sb_in_W_per_m2_K4)))
+    return u.Quantity(teq, "K", copy=False)
 
 
 def planet_luminosity(self, distribution=False, **kw):
@@ -374,9 +466,9 @@ def planet_luminosity(self, distribution=False, **kw):
         If True, return an astropy.uncertainty.Distribution,
         which can be used for error propagation.
     """
-    S = self.insolation(distribution=distribution)
-    R = self.radius(distribution=distribution)
-    L_in = (S * np.pi * R**2).to(u.W)
+    S = self.insolation(distribution=distribution).to_value("W/m**2")
+    R = self.radius(distribution=distribution).to_value("m")
+    L_in = u.Quantity(S * np.pi * R**2, "W", copy=False)
     L_out = L_in
     return L_out
 
@@ -491,20 +583,19 @@ def transit_duration_from_orbit(self, distribution=False, **kw):
     """
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
-        P = self.period(distribution=distribution)
-        scaled_semimajoraxis = self.scaled_semimajoraxis(distribution=distribution)
-        b = self.transit_impact_parameter(distribution=distribution)
-        k = self.scaled_radius(distribution=distribution)
-        T0 = P / np.pi / scaled_semimajoraxis
-        T = T0 * np.sqrt((1 + k**2) - b**2)
-
-        e = self.eccentricity(distribution=distribution)
-        omega = self.argument_of_periastron(distribution=distribution)
-        factor = np.sqrt(1 - e**2) / (1 + e * np.sin(omega))
-
-        duration = (T * factor).to(u.day)
+        P = _strip_unit(self.period(distribution=distribution), "day")
+        a_over_Rs = _strip_unit(
+            self.scaled_semimajoraxis(distribution=distribution), ""
+        )
+        b = _strip_unit(self.transit_impact_parameter(distribution=distribution), "")
+        k = _strip_unit(self.scaled_radius(distribution=distribution), "")
+        e = _strip_unit(self.eccentricity(distribution=distribution), "")
+        omega = _strip_unit(
+            self.argument_of_periastron(distribution=distribution), "rad"
+        )
+        duration = _transit_duration_from_orbit(P, a_over_Rs, k, b, e, omega)
 
-    return duration
+    return u.Quantity(duration, "day", copy=False)
 
 
 def transit_duration(self, distribution=False, **kw):
@@ -580,6 +671,7 @@ def radius_estimated_from_mass(self, distribution=False, **kw):
     return use_chen_and_kipping_to_estimate_radius_from_mass(M=mass)
 
 
+@cache_calculation
 def kludge_mass(self, distribution=False, **kw):
     """
     Planet Mass or msini (Earth masses)
@@ -604,6 +696,7 @@ def kludge_mass(self, distribution=False, **kw):
     )
 
 
+@cache_calculation
 def kludge_radius(self, distribution=False, **kw):
     """
     Planet Radius or Estimated Planet Radius (Earth radii)
@@ -651,7 +744,7 @@ def kludge_stellar_age(self, distribution=False, **kw):
     age = self.get("stellar_age", distribution=distribution)
 
     # try to replace bad ones with NVK3L
-    bad = np.isfinite(age) == False
+    bad = ~np.isfinite(age)
     age[bad] = 5 * u.Gyr
 
     return age
@@ -688,9 +781,8 @@ def surface_gravity(self, kludge=False, distribution=False, **kw):
         M = self.get("mass", distribution=distribution)
         R = self.get("radius", distribution=distribution)
 
-    G = con.G
-    g = (G * M / R**2).to("m/s**2")
-    return g
+    g = _G_in_m3_per_kg_s2 * M.to_value("kg") / R.to_value("m") ** 2
+    return u.Quantity(g, "m/s**2", copy=False)
 
 
 def density(self, kludge=False, distribution=False, **kw):
@@ -724,9 +816,10 @@ def density(self, kludge=False, distribution=False, **kw):
         M = self.get("mass", distribution=distribution)
         R = self.get("radius", distribution=distribution)
 
-    V = 4 / 3 * np.pi * R**3
-    density = (M / V).to("g/cm**3")
-    return density
+    R = R.to_value("cm")
+    V = _four_pi / 3 * R * R * R
+    density = M.to_value("g") / V
+    return u.Quantity(density, "g/cm**3", copy=False)
 
 
 def escape_velocity(self, kludge=False, distribution=False, **kw):
@@ -759,9 +852,10 @@ def escape_velocity(self, kludge=False, distribution=False, **kw):
         M = self.get("mass", distribution=distribution)
         R = self.get("radius", distribution=distribution)
 
-    G = con.G
-    escape_velocity = np.sqrt(2 * G * M / R).to("km/s")
-    return escape_velocity
+    escape_velocity = np.sqrt(
+        2 * _G_in_km3_per_kg_s2 * M.to_value("kg") / R.to_value("km")
+    )
+    return u.Quantity(escape_velocity, "km/s", copy=False)
 
 
 def orbital_velocity(self, distribution=False, **kw):
@@ -778,9 +872,9 @@ def orbital_velocity(self, distribution=False, **kw):
         If True, return an astropy.uncertainty.Distribution,
         which can be used for error propagation.
     """
-    a = self.semimajoraxis(distribution=distribution)
-    P = self.period(distribution=distribution)
-    return (2 * np.pi * a / P).to("km/s")
+    a = self.semimajoraxis(distribution=distribution).to_value("km")
+    P = self.period(distribution=distribution).to_value("s")
+    return u.Quantity(2 * np.pi * a / P, "km/s", copy=False)
 
 
 def impact_velocity(self, distribution=False, **kw):
@@ -798,9 +892,9 @@ def impact_velocity(self, distribution=False, **kw):
         If True, return an astropy.uncertainty.Distribution,
         which can be used for error propagation.
     """
-    v_orbital = self.orbital_velocity(distribution=distribution)
-    v_escape = self.escape_velocity(distribution=distribution)
-    return np.sqrt(v_orbital**2 + v_escape**2)
+    v_orbital = self.orbital_velocity(distribution=distribution).to_value("km/s")
+    v_escape = self.escape_velocity(distribution=distribution).to_value("km/s")
+    return u.Quantity(np.hypot(v_orbital, v_escape), "km/s", copy=False)
 
 
 def escape_parameter(
@@ -872,12 +966,9 @@ def escape_parameter(
         M = self.get("mass", distribution=distribution)
         R = self.get("radius", distribution=distribution)
 
-    k = con.k_B
-    m_p = con.m_p
-    G = con.G
-    e_thermal = k * T
-    e_grav = G * M * m_p / R
-    return (e_grav / e_thermal).decompose()
+    # (G*M*m_p/R) / (k*T), with all the constants pre-combined
+    ratio = _G_m_p_over_k_B * M.to_value("kg") / (R.to_value("m") * T.to_value("K"))
+    return u.Quantity(ratio, u.dimensionless_unscaled, copy=False)
 
 
 def scale_height(self, mu=2.3, albedo=0, f=1 / 4, kludge=False, distribution=False):
@@ -917,9 +1008,9 @@ def scale_height(self, mu=2.3, albedo=0, f=1 / 4, kludge=False, distribution=Fal
         If True, return an astropy.uncertainty.Distribution,
         which can be used for error propagation.
     """
-    k = con.k_B
-    T = self.teq(albedo=albedo, f=f, distribution=distribution)
-    m_p = con.m_p
+    T = self.teq(albedo=albedo, f=f, distribution=distribution).to_value("K")
     g = self.surface_gravity(kludge=kludge, distribution=distribution)
-    H = (k * T / mu / m_p / g).to("km")
-    return H
+
+    # k*T/(mu*m_p*g), with all the constants pre-combined
+    H = _k_B_over_m_p * T / (mu * g.to_value("km/s**2"))
+    return u.Quantity(H, "km", copy=False)
@@ -1,5 +1,8 @@
 from ...imports import *
 
+# 4*pi*sigma_sb as a plain float, for luminosities in Lsun from radii in Rsun
+_four_pi_sigma_sb = 4 * np.pi * con.sigma_sb.to_value("Lsun/(Rsun**2*K**4)")
+
 
 '''def stellar_luminosity_from_table(self, distribution=False, **kw):
     """
@@ -35,11 +38,11 @@ def stellar_luminosity_from_radius_and_teff(self, distribution=False, **kw):
         If True, return an astropy.uncertainty.Distribution,
         which can be used for error propagation.
     """
-    T = self.get("stellar_teff", distribution=distribution)
-    R = self.get("stellar_radius", distribution=distribution)
-    sigma = con.sigma_sb
-    L = (4 * np.pi * R**2 * sigma * T**4).to(u.Lsun)
-    return L
+    T = self.get("stellar_teff", distribution=distribution).to_value("K")
+    R = self.get("stellar_radius", distribution=distribution).to_value("Rsun")
+    T_squared = T * T
+    L = _four_pi_sigma_sb * R * R * T_squared * T_squared
+    return u.Quantity(L, "Lsun", copy=False)
 
 
 def stellar_luminosity(self, distribution=False, **kw):
@@ -1,4 +1,6 @@
 # exoplanet population of all "confirmed" exoplanets from exoplanet archive
+import re
+from concurrent.futures import ThreadPoolExecutor
 from ...imports import *
 from ..predefined import PredefinedPopulation
 from .exoplanet_downloaders import *
@@ -14,6 +16,9 @@ suffixes = [
     "_upper_limit",
 ]
 
+# the human-friendly name is the text between the first '>' and the next '<'
+_reflink_name_pattern = re.compile(r">([^<>]*)")
+
 
 def parse_reflink(x):
     """
@@ -34,11 +39,53 @@ def parse_reflink(x):
         in the same year.
     """
     try:
-        url = x.split("href=")[1].split(" ")[0]
-        name = x.split(">")[1].split("<")[0].replace("&amp;", "+").strip()
-        return name  # , url
-    except AttributeError:
+        match = _reflink_name_pattern.search(x)
+    except TypeError:
+        return ""
+    if match is None:
         return ""
+    return match.group(1).replace("&amp;", "+").strip()
+
+
+def parse_reflinks(column, parsed_names=None):
+    """
+    Convert a whole column of 'reflink/refname' into human-friendly strings.
+
+    Many rows (and columns) share the same reference, so this parses
+    each distinct reflink only once and then spreads the names back
+    out to all rows. Masked (empty) entries become empty strings.
+
+    Parameters
+    ----------
+    column : astropy.table.Column, astropy.table.MaskedColumn, list
+        The reflinks or refnames (see `parse_reflink`).
+    parsed_names : dict, optional
+        Names already parsed from reflinks, which will be reused
+        and added to (to share the parsing between many columns
+        of the same table).
+
+    Returns
+    -------
+    names : array
+        The human-friendly string for each row.
+    """
+    # (work on the plain strings underneath, not masked element access)
+    strings = np.asarray(np.ma.getdata(column), dtype=str)
+    strings = np.where(np.ma.getmaskarray(column), "", strings)
+
+    # (number each distinct string in order of first appearance)
+    codes = {}
+    inverse = [codes.setdefault(x, len(codes)) for x in strings.tolist()]
+
+    if parsed_names is None:
+        parsed_names = {}
+    names = np.empty(len(codes), dtype=object)
+    for i, x in enumerate(codes):
+        try:
+            names[i] = parsed_names[x]
+        except KeyError:
+            names[i] = parsed_names[x] = parse_reflink(x)
+    return names[np.asarray(inverse, dtype=int)].astype(str)
 
 
 class ExoplanetsPSCP(PredefinedPopulation):
@@ -141,6 +188,112 @@ class ExoplanetsPSCP(PredefinedPopulation):
         "pl_ntranspec",
         "default_flag",
     ]
+    # (the same names as sets, for quick membership tests during ingestion)
+    _raw_columns_with_errors_and_limits_set = frozenset(
+        _raw_columns_with_errors_and_limits
+    )
+    _raw_columns_with_errors_set = frozenset(_raw_columns_with_errors)
+    _raw_columns_without_errors_set = frozenset(_raw_columns_without_errors)
+    # define which raw columns become which standardized columns (with what unit)
+    _columns_to_ingest = [
+        # basic reference information
+        ("name", "pl_name", None),
+        ("hostname", "hostname", None),
+        ("letter", "pl_letter", None),
+        ("gaia_id", "gaia_id", None),
+        ("number_of_stars", "sy_snum", None),
+        ("number_of_planets", "sy_pnum", None),
+        # what's the history?
+        ("discovery_method", "discoverymethod", None),
+        ("discovery_year", "disc_year", None),
+        ("discovery_publication", "disc_refname", None),
+        ("discovery_facility", "disc_facility", None),
+        # what are the host positions and kinematics?
+        ("ra", "ra", u.deg),
+        ("dec", "dec", u.deg),
+        ("pmra", "sy_pmra", u.mas / u.year),
+        ("pmdec", "sy_pmdec", u.mas / u.year),
+        ("systemic_rv", "st_radv", u.km / u.s),
+        ("distance", "sy_dist", u.pc),
+        # what are some useful flags?
+        ("detected_in_rv", "rv_flag", None),
+        ("detected_in_pulsar", "pul_flag", None),
+        ("detected_in_pulsation_timing", "ptv_flag", None),
+        ("detected_in_transit", "tran_flag", None),
+        ("detected_in_astrometry", "ast_flag", None),
+        ("detected_in_orbital_brightness_modulations", "obm_flag", None),
+        ("detected_in_microlensing", "micro_flag", None),
+        ("detected_in_eclipse_timing_variations", "etv_flag", None),
+        ("detected_in_imaging", "ima_flag", None),
+        ("detected_in_disk_kinematics", "dkin_flag", None),
+        ("is_controversial", "pl_controv_flag", None),
+        ("shows_ttv", "ttv_flag", None),
+        # (these might need merging from the composite table?!)
+        ("stellar_spectral_type", "st_spectype", None),
+        ("stellar_teff", "st_teff", u.K),
+        ("stellar_radius", "st_rad", u.Rsun),
+        ("stellar_mass", "st_mass", u.Msun),
+        ("stellar_age", "st_age", u.Gyr),
+        ("stellar_metallicity", "st_met", None),
+        ("stellar_luminosity", "st_lum", None),
+        ("stellar_logg", "st_logg", None),
+        ("stellar_density", "st_dens", None),
+        ("stellar_vsini", "st_vsin", None),
+        ("stellar_rotation_period", "st_rotp", None),
+        # what are the stellar magnitudes?
+        *[
+            (f"magnitude_{b}", f"sy_{b.lower()}mag", u.mag)
+            for b in [
+                "u",
+                "g",
+                "r",
+                "i",
+                "z",
+                "V",
+                "B",
+                "IC",
+                "J",
+                "H",
+                "K",
+                "W1",
+                "W2",
+                "W3",
+                "W4",
+                "gaia",
+                "T",
+                "kep",
+            ]
+        ],
+        # what are some basic orbital parameters
+        ("period", "pl_orbper", u.day),
+        ("semimajoraxis", "pl_orbsmax", u.AU),
+        ("eccentricity", "pl_orbeccen", None),
+        ("argument_of_periastron", "pl_orblper", u.deg),
+        ("inclination", "pl_orbincl", u.deg),
+        # what are the planet properties? (check Jupiter isn't better?!)
+        ("radius", "pl_rade", u.Rearth),
+        ("mass", "pl_bmasse", u.Mearth),
+        ("density", "pl_dens", u.g / u.cm**3),
+        ("insolation", "pl_insol", (u.Lsun / 4 / np.pi / (1 * u.AU) ** 2).to("W/m**2")),
+        # ("teq", "pl_eqt", u.K),
+        # does it have transmission + emission spec?
+        ("number_of_transmission_measurements", "pl_ntranspec", None),
+        ("number_of_emission_measurements", "pl_nespec", None),
+        # what are the (often) transit-derived properties?
+        ("transit_midpoint", "pl_tranmid", u.day),
+        ("transit_duration", "pl_trandur", u.hour),
+        ("transit_scaled_radius", "pl_ratror", None),
+        ("transit_depth", "pl_trandep", 0.01),
+        ("transit_scaled_semimajoraxis", "pl_ratdor", None),
+        ("transit_impact_parameter", "pl_imppar", None),
+        # what are the (often) RV-derived properties
+        ("rv_semiamplitude", "pl_rvamp", u.m / u.s),
+        ("msini", "pl_msinie", u.Mearth),
+        ("projected_obliquity", "pl_projobliq", u.deg),
+        ("obliquity", "pl_trueobliq", u.deg),
+        # is this the default parameter set?
+        ("default_parameter_set", "default_flag", None),
+    ]
     _downloader = ExoplanetArchiveDownloader("pscomppars")
 
     def __init__(self, remake=False, **plotkw):
@@ -169,6 +322,38 @@ class ExoplanetsPSCP(PredefinedPopulation):
         PredefinedPopulation.__init__(self, remake=remake, **plotkw)
         # self._add_references_as_indices()
 
+    def _rows_for_tidynames(self, tidynames):
+        """
+        Find all the rows matching some (tidy) planet names.
+
+        A dictionary of names to row indices is built the first
+        time this is called (and again only if the `.standard`
+        table gets replaced), so picking out a few planets from a
+        big table with many rows per planet doesn't need to
+        search through the whole table again.
+
+        Parameters
+        ----------
+        tidynames : list
+            The tidy planet names to look for. Names that
+            aren't in this population will be skipped.
+
+        Returns
+        -------
+        rows : np.ndarray
+            The indices of the matching rows, grouped by name
+            in the same order as `tidynames`.
+        """
+        table, lookup = self.__dict__.get("_tidyname_rows", (None, None))
+        if table is not self.standard:
+            names = np.asarray(self.standard["tidyname"])
+            order = np.argsort(names, kind="stable")
+            unique, first = np.unique(names[order], return_index=True)
+            lookup = dict(zip(unique, np.split(order, first[1:])))
+            self.__dict__["_tidyname_rows"] = (self.standard, lookup)
+        empty = np.array([], dtype=int)
+        return np.concatenate([empty] + [lookup.get(n, empty) for n in tidynames])
+
     def _add_references_as_indices(self):
         """
         Add all keys that look like references as table indices for faster lookup.
@@ -177,7 +362,7 @@ class ExoplanetsPSCP(PredefinedPopulation):
             if "_reference" in k:
                 self._make_sure_index_exists(k)
 
-    def _create_standardized(self, raw):
+    def _create_standardized(self, raw, verbose=False):
         """
         Create a standardized table to make sure that at
         least a few necessary columns are populated.
@@ -192,6 +377,8 @@ class ExoplanetsPSCP(PredefinedPopulation):
         ----------
         raw : astropy.table.QTable
             A raw unstandardized table from `ExoplanetArchiveDownloader`.
+        verbose : bool
+            Should we print a progress note for every column ingested?
 
         Returns
         -------
@@ -202,26 +389,38 @@ class ExoplanetsPSCP(PredefinedPopulation):
         # define the table from which we're deriving everying
         r = raw
 
-        # the new standardized table
-        s = QTable()
+        # (a set of raw column names, for quick lookups)
+        raw_colnames = set(r.colnames)
+
+        # the new standardized columns (made into one table at the end)
+        s = {}
+
+        # (names parsed from reflinks, shared by all the columns citing them)
+        self._parsed_reflink_names = {}
 
         def strip_even_if_masked(x):
             """
-            Flexibly clean strings by removing trailing spaces.
+            Flexibly clean strings by removing trailing spaces,
+            replacing any masked entries with None.
             """
-            try:
-                return x.strip()
-            except AttributeError:
-                return None
+            stripped = np.char.strip(np.ma.getdata(x).astype(str))
+            is_masked = np.ma.getmaskarray(x)
+            if is_masked.any():
+                stripped = stripped.astype(object)
+                stripped[is_masked] = None
+            return stripped
 
         def attach_unit(x, unit=None):
             """
             Flexibly give units to quantities that should have them.
             """
-            if isinstance(x[0], str):
-                return [strip_even_if_masked(a) for a in x]
+            if x.dtype.kind in "US":
+                return strip_even_if_masked(x)
             if unit is None:
                 return x
+            elif isinstance(unit, u.UnitBase):
+                # (wrap the values with a unit, without multiplying a copy)
+                return u.Quantity(np.ma.getdata(x), unit, copy=False)
             else:
                 return x * unit
 
@@ -242,134 +441,107 @@ class ExoplanetsPSCP(PredefinedPopulation):
                 A unit to attach to the quantity, if necessary.
             """
 
-            if k_original not in r.colnames:
+            if k_original not in raw_colnames:
                 warnings.warn(f"⚠️ No {k_original} found!")
                 return
 
-            if k_original in self._raw_columns_without_errors:
+            # names of the related columns, in the raw and standardized tables
+            k_err1 = k_original + "err1"
+            k_err2 = k_original + "err2"
+            k_upper = k_new + "_uncertainty_upper"
+            k_lower = k_new + "_uncertainty_lower"
+            has_limits = k_original in self._raw_columns_with_errors_and_limits_set
+            has_errors = has_limits or (k_original in self._raw_columns_with_errors_set)
+
+            if k_original in self._raw_columns_without_errors_set:
                 # easy, just record the column itself with no error
                 s[k_new] = attach_unit(r[k_original], unit)
-                print(f"📕 populated {k_original} > {k_new}")
+                if verbose:
+                    print(f"📕 populated {k_original} > {k_new}")
 
-            elif k_original in self._raw_columns_with_errors:
+            elif has_errors and not has_limits:
                 # record the column itself
                 s[k_new] = attach_unit(r[k_original], unit)
 
                 # record the upper and lower errorbars
-                s[f"{k_new}_uncertainty_upper"] = attach_unit(
-                    r[f"{k_original}err1"], unit
-                )
-                s[f"{k_new}_uncertainty_lower"] = attach_unit(
-                    r[f"{k_original}err2"], unit
-                )
-                print(f"📏 populated {k_new} and errors with {k_original}")
+                s[k_upper] = attach_unit(r[k_err1], unit)
+                s[k_lower] = attach_unit(r[k_err2], unit)
+                if verbose:
+                    print(f"📏 populated {k_new} and errors with {k_original}")
 
-            elif k_original in self._raw_columns_with_errors_and_limits:
+            elif has_limits:
                 # from playing with table, I think lim = +1 is upper limit, -1 is lower limit
 
                 # record the upper and lower errorbars
-                limit_flag = r[f"{k_original}lim"]
+                limit_flag = r[k_original + "lim"]
+
+                # (rows with a missing flag are never blanked out below)
+                has_flag = ~np.ma.getmaskarray(limit_flag)
+                flag = np.ma.getdata(limit_flag)
+                value = np.ma.filled(r[k_original], np.nan)
 
                 # populate lower limits
-                is_lower = limit_flag == -1
-                if np.sum(is_lower) > 0:
-                    s[f"{k_new}_lower_limit"] = attach_unit(r[f"{k_original}"])
-                    s[f"{k_new}_lower_limit"][is_lower == False] = np.nan
+                is_lower = has_flag & (flag == -1)
+                if is_lower.any():
+                    s[k_new + "_lower_limit"] = np.where(
+                        is_lower | ~has_flag, value, np.nan
+                    )
 
                 # populate upper limits
-                is_upper = limit_flag == +1
-                if np.sum(is_upper) > 0:
-                    s[f"{k_new}_upper_limit"] = attach_unit(r[f"{k_original}"])
-                    s[f"{k_new}_upper_limit"][is_upper == False] = np.nan
+                is_upper = has_flag & (flag == +1)
+                if is_upper.any():
+                    s[k_new + "_upper_limit"] = np.where(
+                        is_upper | ~has_flag, value, np.nan
+                    )
 
                 # populate bounded constraints
-                is_bounded = limit_flag == 0
-                if np.sum(is_bounded) > 0:
-                    s[k_new] = attach_unit(r[k_original], unit)
-                    s[f"{k_new}_uncertainty_upper"] = attach_unit(
-                        r[f"{k_original}err1"], unit
+                is_bounded = has_flag & (flag == 0)
+                if is_bounded.any():
+                    keep = is_bounded | ~has_flag
+                    s[k_new] = attach_unit(np.where(keep, value, np.nan), unit)
+                    s[k_upper] = attach_unit(
+                        np.where(keep, np.ma.filled(r[k_err1], np.nan), np.nan), unit
                     )
-                    s[f"{k_new}_uncertainty_lower"] = attach_unit(
-                        r[f"{k_original}err2"], unit
+                    s[k_lower] = attach_unit(
+                        np.where(keep, np.ma.filled(r[k_err2], np.nan), np.nan), unit
                     )
-                    s[k_new][is_bounded == False] = np.nan
-                    s[f"{k_new}_uncertainty_upper"][is_bounded == False] = np.nan
-                    s[f"{k_new}_uncertainty_lower"][is_bounded == False] = np.nan
 
-                    print(f"👇 populated {k_original} > {k_new} and errors and limits ")
+                    if verbose:
+                        print(
+                            f"👇 populated {k_original} > {k_new} and errors and limits "
+                        )
 
             else:
                 # easy, just record the column itself with no error
                 s[k_new] = attach_unit(r[k_original], unit)
-                print(f"🙋 populated {k_original} > {k_new} , but not 100% sure...")
+                if verbose:
+                    print(f"🙋 populated {k_original} > {k_new} , but not 100% sure...")
 
             # keep track of reference for measurements
-            if (k_original in self._raw_columns_with_errors_and_limits) or (
-                k_original in self._raw_columns_with_errors
-            ):
+            if has_errors:
                 try:
-                    s[f"{k_new}_reference"] = self._ingest_references(r, k_original)
-                    print(
-                        f"⚠️ ingested reference information for {k_original} > {k_new}"
-                    )
+                    s[k_new + "_reference"] = self._ingest_references(r, k_original)
+                    if verbose:
+                        print(
+                            f"⚠️ ingested reference information for {k_original} > {k_new}"
+                        )
                     # s.add_index(f"{k_new}_reference")
                 except (KeyError, AssertionError):
-                    print(
-                        f"⚠️ no reference information found for {k_original} > {k_new}"
-                    )
-
-        # basic reference information
-        populate_one_or_more_columns("name", "pl_name")
-        populate_one_or_more_columns("hostname", "hostname")
-        populate_one_or_more_columns("letter", "pl_letter")
-        populate_one_or_more_columns("gaia_id", "gaia_id")
-        populate_one_or_more_columns("number_of_stars", "sy_snum")
-        populate_one_or_more_columns("number_of_planets", "sy_pnum")
-
-        # what's the history?
-        populate_one_or_more_columns("discovery_method", "discoverymethod")
-        populate_one_or_more_columns("discovery_year", "disc_year")
-        populate_one_or_more_columns("discovery_publication", "disc_refname")
-        s["discovery_publication"] = [
-            parse_reflink(x) for x in s["discovery_publication"]
-        ]
-        populate_one_or_more_columns("discovery_facility", "disc_facility")
+                    if verbose:
+                        print(
+                            f"⚠️ no reference information found for {k_original} > {k_new}"
+                        )
 
-        # what are the host positions and kinematics?
-        populate_one_or_more_columns("ra", "ra", u.deg)
-        populate_one_or_more_columns("dec", "dec", u.deg)
-        populate_one_or_more_columns("pmra", "sy_pmra", u.mas / u.year)
-        populate_one_or_more_columns("pmdec", "sy_pmdec", u.mas / u.year)
-        populate_one_or_more_columns("systemic_rv", "st_radv", u.km / u.s)
-        populate_one_or_more_columns("distance", "sy_dist", u.pc)
+        # ingest all the columns (see `_columns_to_ingest`)
+        for k_new, k_original, unit in self._columns_to_ingest:
+            populate_one_or_more_columns(k_new, k_original, unit)
 
-        # what are some useful flags?
-        populate_one_or_more_columns("detected_in_rv", "rv_flag")
-        populate_one_or_more_columns("detected_in_pulsar", "pul_flag")
-        populate_one_or_more_columns("detected_in_pulsation_timing", "ptv_flag")
-        populate_one_or_more_columns("detected_in_transit", "tran_flag")
-        populate_one_or_more_columns("detected_in_astrometry", "ast_flag")
-        populate_one_or_more_columns(
-            "detected_in_orbital_brightness_modulations", "obm_flag"
-        )
-        populate_one_or_more_columns("detected_in_microlensing", "micro_flag")
-        populate_one_or_more_columns(
-            "detected_in_eclipse_timing_variations", "etv_flag"
+        # convert from the reflinks to human-friendly names
+        s["discovery_publication"] = parse_reflinks(
+            s["discovery_publication"], self._parsed_reflink_names
         )
-        populate_one_or_more_columns("detected_in_imaging", "ima_flag")
-        populate_one_or_more_columns("detected_in_disk_kinematics", "dkin_flag")
+        del self._parsed_reflink_names
 
-        populate_one_or_more_columns("is_controversial", "pl_controv_flag")
-        populate_one_or_more_columns("shows_ttv", "ttv_flag")
-
-        # (these might need merging from the composite table?!)
-        populate_one_or_more_columns("stellar_spectral_type", "st_spectype")
-        populate_one_or_more_columns("stellar_teff", "st_teff", u.K)
-        populate_one_or_more_columns("stellar_radius", "st_rad", u.Rsun)
-        populate_one_or_more_columns("stellar_mass", "st_mass", u.Msun)
-        populate_one_or_more_columns("stellar_age", "st_age", u.Gyr)
-        populate_one_or_more_columns("stellar_metallicity", "st_met")
-        populate_one_or_more_columns("stellar_luminosity", "st_lum")
         # convert from table log10(L) to L
         logL = s["stellar_luminosity"] * 1
         L = 10**logL * u.Lsun
@@ -383,86 +555,13 @@ class ExoplanetsPSCP(PredefinedPopulation):
             np.log(10) * L * np.abs(logL_uncertainty_upper)
         )
 
-        populate_one_or_more_columns("stellar_logg", "st_logg")
-        populate_one_or_more_columns("stellar_density", "st_dens")
-        populate_one_or_more_columns("stellar_vsini", "st_vsin")
-        populate_one_or_more_columns("stellar_rotation_period", "st_rotp")
-
-        # what are the stellar magnitudes?
-        bands = [
-            "u",
-            "g",
-            "r",
-            "i",
-            "z",
-            "V",
-            "B",
-            "IC",
-            "J",
-            "H",
-            "K",
-            "W1",
-            "W2",
-            "W3",
-            "W4",
-            "gaia",
-            "T",
-            "kep",
-        ]
-        for b in bands:
-            populate_one_or_more_columns(f"magnitude_{b}", f"sy_{b.lower()}mag", u.mag)
-
-        # what are some basic orbital parameters
-        populate_one_or_more_columns("period", "pl_orbper", u.day)
-        populate_one_or_more_columns("semimajoraxis", "pl_orbsmax", u.AU)
-        populate_one_or_more_columns("eccentricity", "pl_orbeccen")
-        populate_one_or_more_columns("argument_of_periastron", "pl_orblper", u.deg)
-        populate_one_or_more_columns("inclination", "pl_orbincl", u.deg)
-
-        # what are the planet properties? (check Jupiter isn't better?!)
-        populate_one_or_more_columns("radius", "pl_rade", u.Rearth)
-        populate_one_or_more_columns("mass", "pl_bmasse", u.Mearth)
-        populate_one_or_more_columns("density", "pl_dens", u.g / u.cm**3)
-        populate_one_or_more_columns(
-            "insolation",
-            "pl_insol",
-            (u.Lsun / 4 / np.pi / (1 * u.AU) ** 2).to("W/m**2"),
-        )
-        # populate_one_or_more_columns("teq", "pl_eqt", u.K)
-
-        # does it have transmission + emission spec?
-        populate_one_or_more_columns(
-            "number_of_transmission_measurements", "pl_ntranspec"
-        )
-        populate_one_or_more_columns("number_of_emission_measurements", "pl_nespec")
-
-        # what are the (often) transit-derived properties?
-        populate_one_or_more_columns("transit_midpoint", "pl_tranmid", u.day)
-        populate_one_or_more_columns("transit_duration", "pl_trandur", u.hour)
-        populate_one_or_more_columns("transit_scaled_radius", "pl_ratror")
-        populate_one_or_more_columns("transit_depth", "pl_trandep", 0.01)
-        populate_one_or_more_columns("transit_scaled_semimajoraxis", "pl_ratdor")
-        populate_one_or_more_columns("transit_impact_parameter", "pl_imppar")
-
-        # what are the (often) RV-derived properties
-        populate_one_or_more_columns("rv_semiamplitude", "pl_rvamp", u.m / u.s)
-        populate_one_or_more_columns("msini", "pl_msinie", u.Mearth)
-        populate_one_or_more_columns("projected_obliquity", "pl_projobliq", u.deg)
-        populate_one_or_more_columns("obliquity", "pl_trueobliq", u.deg)
-
-        # is this the default parameter set?
-        populate_one_or_more_columns("default_parameter_set", "default_flag")
-
-        # sort these planets by their names
+        # build the table all at once, then sort these planets by their names
+        s = QTable(s)
         s.sort("name")
 
-        # set the fill_value for any numeric columns to nans
-        for k in s.colnames:
-            if not isinstance(s[k][0], str):
-                s[k].fill_value = np.nan
-
         # fill in all the masked elements to make an unmasked array with nans
-        standard = s.filled()
+        # (string columns were already unmasked as they were ingested)
+        standard = s.filled(np.nan)
 
         #
         trimmed = self._trim_bad_data(standard)
@@ -518,7 +617,7 @@ class ExoplanetsPSCP(PredefinedPopulation):
                     f"🚨😳🔔‼️ some values with zero-uncertainty might have snuck through for {k} 🚨😳🔔‼️🚨😳🔔‼️"
                 )
             N_has_uncertainty = np.sum(ok)
-            bad = ok == False
+            bad = ~ok
             print(
                 f"""{k:>20}: {N_has_value:>4} values and {N_has_uncertainty:>4} with uncertainties ({N_has_uncertainty/N_has_value:>6.1%})"""
             )
@@ -547,7 +646,9 @@ class ExoplanetsPSCP(PredefinedPopulation):
         k_reference = f"{k}_reflink"
 
         # get a bibcode for this quantity from each row
-        list_of_references = [parse_reflink(x) for x in r[k_reference]]
+        list_of_references = parse_reflinks(
+            r[k_reference], self.__dict__.get("_parsed_reflink_names")
+        )
 
         return list_of_references
 
@@ -608,10 +709,38 @@ class ExoplanetsPS(ExoplanetsPSCP):
         # define a column name for this quantity
         k_reference = f"{prefix}_refname"
 
-        # get a bibcode for this quantity from each row
-        list_of_references = [parse_reflink(x) for x in r[k_reference]]
+        # many quantities share each reference column, so parse each only once
+        parsed = self.__dict__.get("_parsed_references", {})
+        if k_reference not in parsed:
+            # get a bibcode for this quantity from each row
+            parsed[k_reference] = parse_reflinks(
+                r[k_reference], self.__dict__.get("_parsed_reflink_names")
+            )
 
-        return list_of_references
+        return parsed[k_reference]
+
+    def _create_standardized(self, raw, verbose=False):
+        """
+        Create a standardized table (see `ExoplanetsPSCP._create_standardized`),
+        remembering the parsed '*_refname' columns only while doing so.
+
+        Parameters
+        ----------
+        raw : astropy.table.QTable
+            A raw unstandardized table from `ExoplanetArchiveDownloader`.
+        verbose : bool
+            Should we print a progress note for every column ingested?
+
+        Returns
+        -------
+        standard : astropy.table.QTable
+            A standardize table of exoplanet properties.
+        """
+        self._parsed_references = {}
+        try:
+            return ExoplanetsPSCP._create_standardized(self, raw, verbose=verbose)
+        finally:
+            del self._parsed_references
 
 
 class Exoplanets(ExoplanetsPSCP):
@@ -627,13 +756,13 @@ class Exoplanets(ExoplanetsPSCP):
 
     label = "Exoplanets"
 
-    def __init__(self, remake=False, **plotkw):
+    def __init__(self, remake=False, with_individual_references=False, **plotkw):
         """
         Initialize a population of all known exoplanet from
         the NASA Exoplanet Archive `pscomppars` and `ps` tables.
 
         The standard population comes only from `pscomppars`.
-        However, it should secretly also download the `ps` table,
+        However, it can secretly also download the `ps` table,
         which would enable the user to choose to replace
         parameters for a particular planet by choosing a
         particular reference.
@@ -643,14 +772,43 @@ class Exoplanets(ExoplanetsPSCP):
         remake : bool
             Should the population be remade from raw files,
             even if a recent version already exists?
+        with_individual_references : bool
+            Should the `ps` table be loaded too? If so, it's
+            downloaded and ingested at the same time as the
+            `pscomppars` table, rather than afterward via
+            `.load_individual_references()`.
         **plotkw : dict
             All other keywords will go toward defining
             default plotting styles, for example like
             'alpha', 'marker', 'zorder', 'color', ...
         """
 
-        # load standard table(s) or ingest from raw data
-        PredefinedPopulation.__init__(self, remake=remake, **plotkw)
+        if with_individual_references:
+            # (settle whether an expired `ps` table should be downloaded here,
+            # so only the main thread ever asks the user for input)
+            if remake is None:
+                downloader = ExoplanetsPS._downloader
+                remake_ps = check_if_needs_updating(
+                    downloader.path, downloader._expiration
+                )
+            else:
+                remake_ps = remake
+
+            # load the `ps` table in the background while `pscomppars` loads
+            executor = ThreadPoolExecutor(max_workers=1)
+            future = executor.submit(ExoplanetsPS, remake=remake_ps)
+            try:
+                PredefinedPopulation.__init__(self, remake=remake, **plotkw)
+            except BaseException:
+                # (don't wait for `ps` to finish before raising the error)
+                future.cancel()
+                executor.shutdown(wait=False)
+                raise
+            self._individual_references_to_trim = future.result()
+            executor.shutdown()
+        else:
+            # load standard table(s) or ingest from raw data
+            PredefinedPopulation.__init__(self, remake=remake, **plotkw)
 
     def __getitem__(self, key):
         """
@@ -675,15 +833,49 @@ class Exoplanets(ExoplanetsPSCP):
         # first call the normal `Population` indexing/slicing/masking
         subset = super().__getitem__(key)
 
-        # then trim the .ps population to only those (host)names in the subset
-        if hasattr(self, "individual_references"):
-            subset.individual_references = self.individual_references[
-                list(np.unique(subset.tidyname()))
-            ]
-            subset.individual_references.label = "Individual References"
+        # then remember the .ps population, to be trimmed only if it's needed
+        source = self.__dict__.get(
+            "individual_references",
+            self.__dict__.get("_individual_references_to_trim"),
+        )
+        if source is not None:
+            subset._individual_references_to_trim = source
 
         return subset
 
+    def __getattr__(self, key):
+        """
+        Trim the hidden `ExoplanetsPS` table the first time it's needed.
+
+        A subset made with `__getitem__` only remembers the larger
+        `.individual_references` population it came from. The first
+        time `.individual_references` is requested, that gets trimmed
+        down to the planets in this subset, and the result is stored
+        as a normal attribute. All other keys go to `Population.__getattr__`.
+
+        Parameters
+        ----------
+        key : str
+            The attribute we're trying to get.
+
+        Returns
+        -------
+        value : any
+            The attribute we're trying to get.
+        """
+        if (key == "individual_references") and (
+            "_individual_references_to_trim" in self.__dict__
+        ):
+            source = self.__dict__.pop("_individual_references_to_trim")
+            rows = source._rows_for_tidynames(np.unique(self.tidyname()))
+            self.individual_references = type(source)(
+                standard=source.standard[rows],
+                label="Individual References",
+                **source._plotkw,
+            )
+            return self.individual_references
+        return super().__getattr__(key)
+
     def load_individual_references(self):
         """
         Populate an internal `.individual_references` population
@@ -976,3 +1168,6 @@ class Exoplanets(ExoplanetsPSCP):
 
         if nothing_happened:
             warnings.warn(warning_message)
+        else:
+            # any remembered calculations will be out of date
+            self._invalidate_cache()
@@ -398,11 +398,12 @@ def make_skew_samples_from_lowerupper(
     )
 
     # populate empty array with nans, to skip asking skewnormal to handle them
-    ok = np.isfinite(mu_skew * sigma_skew * alpha_skew)
+    # (indices are cheaper than a boolean mask to reuse across many arrays)
+    ok = np.flatnonzero(np.isfinite(mu_skew * sigma_skew * alpha_skew))
     samples = np.ones((N_samples, N_data)) * mu[np.newaxis, :] * np.nan
 
     # create zero-centered, unnormalized skewnormal distribution + samples
     p = skewnorm(loc=mu_skew[ok], scale=sigma_skew[ok], a=alpha_skew[ok])
-    samples[:, ok] = p.rvs(size=(N_samples, sum(ok))) * sigma_lower[ok] + mu[ok]
+    samples[:, ok] = p.rvs(size=(N_samples, len(ok))) * sigma_lower[ok] + mu[ok]
 
     return samples.T
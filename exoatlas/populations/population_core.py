@@ -5,6 +5,7 @@ from ..imports import *
 # from ..models import *
 from .column_descriptions import *
 from .pineda_skew import make_skew_samples_from_lowerupper, gaussian_central_1sigma
+from .calculations.caching import forget_all_calculations
 
 # these are keywords that can be set for a population
 default_plotkw = dict(
@@ -333,6 +334,7 @@ class Population(Talker):
                 f"'.{name}()' already exists in `.standard` for this Population; please consider a different name!"
             )
         setattr(self, name, self._create_function_to_access_table_quantity(name))
+        self._invalidate_cache()
 
     def add_calculation(self, name, function):
         """
@@ -374,6 +376,20 @@ class Population(Talker):
 
         setattr(self.__class__, name, function)
 
+        # (this changes the calculation for every population of this class)
+        forget_all_calculations()
+
+    def _invalidate_cache(self):
+        """
+        Forget any calculations that have been remembered.
+
+        Some calculations store their values after they're first
+        done (see `calculations.caching.cache_calculation`). This
+        clears them, and should be called whenever the data in
+        the `.standard` table change.
+        """
+        self.__dict__["_calculation_cache"] = {}
+
     def print_column_summary(self):
         """
         Print a summary of columns that come directly from the `.standard` table.
@@ -834,6 +850,32 @@ class Population(Talker):
         # unc = 0 * _clean_column(self.standard[key])
         # return unc, unc
 
+    def _peek_column(self, key):
+        """
+        Peek at the plain values of a column in the standardized table.
+
+        Unlike `.get_values_from_table`, this doesn't make a copy
+        (or attach any units), so it's a quick way for calculations
+        to check on the contents of a column. The array it returns
+        is read-only, to avoid accidentally modifying the table.
+
+        Parameters
+        ----------
+        key : str
+            The column to look at. This must exactly match a
+            column in `.standard`; if not, `KeyError` will be raised.
+
+        Returns
+        -------
+        values : array
+            A read-only view of the values in the column,
+            in whatever units they're stored in the table.
+        """
+        column = self.standard[key]
+        values = np.asarray(getattr(column, "value", column)).view()
+        values.flags.writeable = False
+        return values
+
     def get_values_from_table(self, key, distribution=False):
         """
         Retrieve values directly from the standardized table.
@@ -1037,6 +1079,10 @@ class Population(Talker):
             # otherwise, store attributes as normal for objects
             self.__dict__[key] = value
 
+            # replacing the table means remembered calculations are stale
+            if key == "standard":
+                self._invalidate_cache()
+
     def __repr__(self):
         """
         How should this object appear as a repr/str?
@@ -1184,13 +1230,14 @@ class Population(Talker):
 
         N = len(self.standard)
         for k in basic_columns:
+            column = self.standard[k]
             try:
-                n = sum(self.standard[k].mask == False)
+                n = np.count_nonzero(~column.mask)
             except AttributeError:
                 try:
-                    n = sum(np.isfinite(self.standard[k]))
+                    n = np.count_nonzero(np.isfinite(column))
                 except TypeError:
-                    n = sum(np.atleast_1d(self.standard[k] != ""))
+                    n = np.count_nonzero(np.atleast_1d(column != ""))
             self._speak(f"{k:>25} | {n:4}/{N} rows = {n/N:4.0%} are not empty")
 
     def _find_index(self, name):
@@ -1242,6 +1289,9 @@ class Population(Talker):
         # extract just the subsection of the table relating to these planets
         i = self.standard.loc_indices[planets_to_index]
 
+        # any remembered calculations will be out of date
+        self._invalidate_cache()
+
         # loop over keyword arguments
         for k, v in kwargs.items():
 
@@ -1402,68 +1452,113 @@ class Population(Talker):
         #
         errors_indicating_missing_data = (AttributeError, KeyError)
 
+        # once nothing is missing, lower-preference options will never be chosen
+        can_stop_early = (
+            (how_to_choose == "preference") and (not distribution) and (not visualize)
+        )
+
         # construct a list of arrays of values
-        value_estimates = []
+        value_estimates, available_methods = [], []
         for m in methods:
+            # skip options that obviously can't work, without raising errors
+            if m.endswith("_from_table"):
+                if m[: -len("_from_table")] not in self.standard.colnames:
+                    continue
+            elif not ((m in self.__dict__) or hasattr(type(self), m)):
+                continue
+
             try:
                 this = self.get(m, distribution=distribution, **kw)
                 value_estimates.append(this)
+                available_methods.append(m)
             except errors_indicating_missing_data:
-                pass
+                continue
+            if can_stop_early and np.all(np.isfinite(this)):
+                break
+
+        # stack the estimates into one (method, element[, sample]) array
+        unit = getattr(value_estimates[0], "unit", None)
+        is_distribution = np.any([isinstance(v, Distribution) for v in value_estimates])
+        if is_distribution:
+            samples = np.broadcast_arrays(
+                *[
+                    (
+                        v.distribution
+                        if isinstance(v, Distribution)
+                        else v[..., np.newaxis]
+                    )
+                    for v in value_estimates
+                ],
+                subok=True,
+            )
+        else:
+            samples = value_estimates
+        common_unit = unit or u.dimensionless_unscaled
+        stacked = np.stack(
+            [
+                u.Quantity(x, common_unit, copy=False).to_value(common_unit)
+                for x in samples
+            ]
+        )
 
         if how_to_choose == "preference":
-            # loop through options, picking the first finite value
-            for i, v in enumerate(value_estimates):
-                if i == 0:
-                    values = v
-                isnt_good_yet = np.isfinite(values) == False
-                values[isnt_good_yet] = v[isnt_good_yet]
+            # pick the first option with a finite value, element-wise
+            is_finite = np.isfinite(stacked)
+            which = np.argmax(is_finite, axis=0)
         elif how_to_choose == "precision":
             # calculate (symmetric) fractional uncertainties for all options
             mu_estimates = []
-            for m in methods:
+            for m in available_methods:
                 try:
                     this = self.get(m, distribution=False, **kw)
                     mu_estimates.append(this)
                 except errors_indicating_missing_data:
                     pass
             uncertainty_estimates = []
-            for m in methods:
+            for m in available_methods:
                 try:
                     this = self.get_uncertainty(m, **kw)
                     uncertainty_estimates.append(this)
                 except errors_indicating_missing_data:
                     pass
 
-            fractional_uncertainty_estimates = [
-                u / v for v, u in zip(mu_estimates, uncertainty_estimates)
-            ]
-            # loop through options to select the one with smallest uncertainty
-            for i, (v, f) in enumerate(
-                zip(value_estimates, fractional_uncertainty_estimates)
-            ):
-                f[np.isnan(f)] = np.inf
-                if i == 0:
-                    values = v
-                    current_fractional_uncertainty = f
-                has_smaller_uncertainty = f < current_fractional_uncertainty
-                current_fractional_uncertainty[has_smaller_uncertainty] = f[
-                    has_smaller_uncertainty
+            fractional_uncertainty_estimates = np.stack(
+                [
+                    u.Quantity(s / m, u.dimensionless_unscaled, copy=False).to_value(
+                        u.dimensionless_unscaled
+                    )
+                    for m, s in zip(mu_estimates, uncertainty_estimates)
                 ]
-                values[has_smaller_uncertainty] = v[has_smaller_uncertainty]
+            )
+            # pick the option with the smallest uncertainty, element-wise
+            fractional_uncertainty_estimates[
+                np.isnan(fractional_uncertainty_estimates)
+            ] = np.inf
+            which = np.argmin(fractional_uncertainty_estimates, axis=0)
         else:
             raise ValueError(
                 f"""
             "{how_to_choose}" is not a valid option choosing from among
             {methods}
-            Only "preference" or "precision" are currently allowed. 
+            Only "preference" or "precision" are currently allowed.
             """
             )
 
+        # gather the chosen option for each element (and sample) in one pass
+        which = which.reshape(
+            (1,) + which.shape + (1,) * (stacked.ndim - which.ndim - 1)
+        )
+        chosen = np.take_along_axis(stacked, which, axis=0)[0]
+        if how_to_choose == "preference":
+            chosen[~np.any(is_finite, axis=0)] = np.nan
+        if unit is not None:
+            chosen = chosen * unit
+        values = Distribution(chosen) if is_distribution else chosen
+
         if visualize:
             plt.figure(figsize=(8, 3))
             if distribution:
-                for m, v in zip(methods, value_estimates):
+                for m, v in zip(available_methods, value_estimates):
                     plt.violinplot(
                         dataset=np.array(v.distribution.T), positions=np.arange(len(v))
                     )
@@ -1474,7 +1569,7 @@ class Population(Talker):
                     markerfacecolor="none",
                 )
             else:
-                for m, v in zip(methods, value_estimates):
+                for m, v in zip(available_methods, value_estimates):
                     plt.plot(v, alpha=0.5, label=m, marker=".")
                 plt.plot(
                     values,
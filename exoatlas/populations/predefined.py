@@ -1,3 +1,5 @@
+import pickle, platform
+import astropy
 from .population_core import *
 
 
@@ -128,10 +130,76 @@ class PredefinedPopulation(Population):
             with a minimal set of columns.
         """
 
+        # describe the text table (and libraries) a binary copy must match
+        expected = self._describe_standardized_data()
+
+        # a binary copy of the text table is much faster to load, if it's up to date
+        binary_path = self._standardized_binary_path
+        try:
+            with open(binary_path, "rb") as f:
+                cached = pickle.load(f)
+            if (cached["description"] == expected) and isinstance(
+                cached["standard"], Table
+            ):
+                self._speak(f"Loaded standardized table from {binary_path}")
+                return cached["standard"]
+            self._speak(f"{binary_path} is out of date; using the text table instead.")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # (anything else that goes wrong just means we can't use the copy)
+            self._speak(
+                f"Couldn't load {binary_path} ({e!r}); using the text table instead."
+            )
+
         # keywords for reading a standardized table
         read_kw = dict(format="ecsv", fill_values=[("", np.nan), ("--", np.nan)])
 
         standard = ascii.read(self._standardized_data_path, **read_kw)
         self._speak(f"Loaded standardized table from {self._standardized_data_path}")
 
+        # save a binary copy of exactly what was loaded, for next time
+        try:
+            with open(binary_path, "wb") as f:
+                pickle.dump(
+                    dict(description=expected, standard=standard),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except Exception as e:
+            # (the text table is still there, so this is just slower next time)
+            self._speak(f"Couldn't save {binary_path} ({e!r}).")
+
         return standard
+
+    @property
+    def _standardized_binary_path(self):
+        """
+        Define the filepath for a binary copy of the standardized table.
+        """
+        return os.path.splitext(self._standardized_data_path)[0] + ".pickle"
+
+    def _describe_standardized_data(self):
+        """
+        Describe the standardized text table and the libraries reading it.
+
+        A binary copy of the standardized table is only trusted if
+        this description matches the one saved alongside it, so
+        changing, replacing, or re-timestamping the text table (or
+        upgrading Python, numpy, or astropy) means the text
+        table gets read again.
+
+        Returns
+        -------
+        description : dict
+            The size and modification time of the text table,
+            and the versions of the libraries used to read it.
+        """
+        stat = os.stat(self._standardized_data_path)
+        return dict(
+            size=stat.st_size,
+            mtime=stat.st_mtime_ns,
+            python=platform.python_version(),
+            numpy=np.__version__,
+            astropy=astropy.__version__,
+        )
@@ -89,7 +89,7 @@ class SolarSystemMinorPlanets(PredefinedPopulation):
 
         # set the fill_value for any numeric columns to nans
         for k in s.colnames:
-            if not isinstance(s[k][0], str):
+            if s[k].dtype.kind not in "US":
                 s[k].fill_value = np.nan
 
         # fill in all the masked elements to make an unmasked array with nans
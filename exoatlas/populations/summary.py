@@ -51,14 +51,14 @@ def plot_histograms(pop):
             good = np.isfinite(pop.standard[x])
         else:
             good = np.ones(len(pop.standard)).astype(bool)
-        bad = good == False
-        badfraction = sum(bad) / len(bad)
+        bad = ~good
+        badfraction = np.count_nonzero(bad) / len(bad)
 
         plt.sca(ax.flatten()[i])
         plt.hist(pop.standard[x][good], color="black")
         plt.axvspan(*plt.xlim(), 0, badfraction, color="red", alpha=0.5, zorder=-1)
         plt.xlabel(x)
-        plt.title(f"{x} lacks {sum(bad)}/{len(bad)} ({badfraction:.0%})")
+        plt.title(f"{x} lacks {np.count_nonzero(bad)}/{len(bad)} ({badfraction:.0%})")
 
 
 def summarize_planet(planets):
@@ -111,3 +111,70 @@ def test_add_calculations():
     s.add_calculation(name="surface_area", function=f)
     s.surface_area()
     s.surface_area_uncertainty()
+
+
+def test_mixed_distributions():
+    """
+    Do calculations work when only some inputs have uncertainties?
+    """
+    t = QTable()
+    t["name"] = ["a", "b", "c"]
+    t["hostname"] = ["A", "B", "C"]
+    t["semimajoraxis"] = [0.1, 1.0, 5.0] * u.AU
+    t["stellar_radius"] = [0.5, 1.0, 2.0] * u.Rsun
+    t["stellar_radius_uncertainty"] = [0.05, 0.1, 0.2] * u.Rsun
+    t["stellar_teff"] = [3500, 5800, 7000] * u.K
+    t["stellar_teff_uncertainty"] = [100, 100, 100] * u.K
+    p = Population(standard=t, label="mixed")
+
+    # luminosity is a distribution, but semimajor axis is not
+    assert isinstance(p.stellar_luminosity(distribution=True), Distribution)
+    assert not isinstance(p.semimajoraxis(distribution=True), Distribution)
+    for k in ["insolation", "relative_insolation", "teq"]:
+        x = p.get(k, distribution=True)
+        assert isinstance(x, Distribution)
+        assert x.shape == (3,)
+
+
+def test_cached_calculations():
+    """
+    Are remembered calculations reused, protected, and forgotten when needed?
+    """
+    s = SolarSystem()
+    t = SolarSystem()
+
+    # repeated calls (positional or not) give the same values
+    teq = s.teq()
+    assert np.all(s.teq() == teq)
+    assert np.all(s.teq(False, 0.3) == s.teq(albedo=0.3))
+    assert np.all(s.teq(False, 0.3) < teq)
+
+    # modifying the returned values doesn't change the remembered ones
+    x = s.teq()
+    x *= 2
+    assert np.all(s.teq() == teq)
+
+    # asking for a plot always makes one
+    plt.close("all")
+    s.semimajoraxis(visualize=True)
+    s.semimajoraxis(visualize=True)
+    assert len(plt.get_fignums()) == 2
+    plt.close("all")
+
+    # replacing the table forgets remembered values
+    s.standard = s.standard[:3]
+    assert len(s.teq()) == 3
+
+    # adding a calculation forgets remembered values for everyone
+    a = t.semimajoraxis()
+
+    def semimajoraxis(self, distribution=False, **kw):
+        return 2 * self.semimajoraxis_from_table(distribution=distribution)
+
+    try:
+        s.add_calculation(name="semimajoraxis", function=semimajoraxis)
+        assert np.allclose(t.semimajoraxis(), 2 * a)
+    finally:
+        # (put the original calculation back for other tests)
+        s.add_calculation(name="semimajoraxis", function=Population.semimajoraxis)
+    assert np.allclose(t.semimajoraxis(), a)
@@ -1,6 +1,9 @@
 from .setup_tests import *
 
 from exoatlas import *
+from exoatlas.populations.exoplanets.exoplanets import parse_reflink, parse_reflinks
+from astropy.table import MaskedColumn
+import threading
 
 
 def test_load_references():
@@ -30,3 +33,167 @@ def test_update_values():
     assert one.get("mass") == 1 * u.M_earth
     assert one.get_uncertainty("mass") == 0.1 * u.M_earth
     assert one.get_uncertainty_lowerupper("mass")[0] == 0.1 * u.M_earth
+
+
+# some 'reflink/refname' strings, as they appear in the NASA Exoplanet Archive
+torres = "<a refstr=TORRES_ET_AL__2008 href=https://ui.adsabs.harvard.edu/abs/2008ApJ...677.1324T/abstract target=ref> Torres et al. 2008 </a>"
+ivshina = "<a refstr=IVSHINA__AMP__WINN_2022 href=https://ui.adsabs.harvard.edu/abs/2022ApJS..259...62I/abstract target=ref>Ivshina &amp; Winn 2022</a>"
+calculated = "<a refstr=CALCULATED_VALUE target=_blank>Calculated Value</a>"
+nameless = (
+    "<a refstr=NOTHING href=https://exoplanetarchive.ipac.caltech.edu target=ref></a>"
+)
+
+
+def test_parse_reflinks():
+    """
+    Do reflinks turn into the right human-friendly names, in the right rows?
+    """
+    assert parse_reflink(torres) == "Torres et al. 2008"
+    assert parse_reflink(ivshina) == "Ivshina + Winn 2022"
+    assert parse_reflink(calculated) == "Calculated Value"
+    assert parse_reflink(nameless) == ""
+    assert parse_reflink("") == ""
+    assert parse_reflink(None) == ""
+
+    strings = [ivshina, torres, "", calculated, torres, nameless, ivshina]
+    assert list(parse_reflinks(strings)) == [parse_reflink(x) for x in strings]
+
+    # masked entries should come out empty, with all rows in their original order
+    column = MaskedColumn(
+        strings, mask=[False, False, False, False, True, False, False]
+    )
+    assert list(parse_reflinks(column)) == [
+        "Ivshina + Winn 2022",
+        "Torres et al. 2008",
+        "",
+        "Calculated Value",
+        "",
+        "",
+        "Ivshina + Winn 2022",
+    ]
+    assert len(parse_reflinks([])) == 0
+
+    # names parsed for one column can be reused for the next
+    parsed_names = {}
+    parse_reflinks(strings, parsed_names)
+    assert parsed_names[torres] == "Torres et al. 2008"
+    parsed_names[torres] = "(already parsed)"
+    assert list(parse_reflinks([torres], parsed_names)) == ["(already parsed)"]
+
+
+def fake_table(names):
+    """
+    Make a minimal standardized table of planets.
+    """
+    t = QTable()
+    t["name"] = names
+    t["hostname"] = [x[:-1] for x in names]
+    t["period"] = np.arange(len(names)) * u.day
+    return t
+
+
+def test_rows_for_tidynames():
+    """
+    Can we find all the rows for some planets, in order?
+    """
+    ps = ExoplanetsPS(standard=fake_table(["B b", "A b", "B b", "C b", "A b"]))
+    assert list(ps._rows_for_tidynames(["bb", "ab", "zzz"])) == [0, 2, 1, 4]
+    assert list(ps._rows_for_tidynames(["cb"])) == [3]
+    assert len(ps._rows_for_tidynames([])) == 0
+
+    # replacing the table means the rows should be found again
+    ps.standard = ps.standard[::-1]
+    assert list(ps._rows_for_tidynames(["cb", "bb"])) == [1, 2, 4]
+
+
+def test_trim_individual_references():
+    """
+    Are individual references trimmed (only) when a subset needs them?
+    """
+    e = Exoplanets(standard=fake_table(["A b", "B b", "C b"]))
+    e.individual_references = ExoplanetsPS(
+        standard=fake_table(["B b", "A b", "B b", "C b", "A b"])
+    )
+
+    # a subset remembers its source, but doesn't trim it yet
+    subset = e[["A b", "B b"]]
+    assert "individual_references" not in subset.__dict__
+    assert list(subset.individual_references.name()) == ["A b", "A b", "B b", "B b"]
+    assert np.all(subset.individual_references.period() == [1, 4, 0, 2] * u.day)
+
+    # a subset of a subset trims from the already-trimmed references
+    smaller = subset["B b"]
+    assert list(smaller.individual_references.name()) == ["B b", "B b"]
+
+
+def test_shared_references():
+    """
+    Is each reference column in the `ps` table parsed only once?
+    """
+    raw = Table(
+        dict(
+            pl_refname=[torres, ivshina, torres],
+            st_refname=[calculated, calculated, nameless],
+        )
+    )
+    ps = ExoplanetsPS(standard=fake_table(["A b", "B b", "C b"]))
+
+    # while ingesting, quantities sharing a reference column share its names
+    ps._parsed_references = {}
+    period = ps._ingest_references(raw, "pl_orbper")
+    radius = ps._ingest_references(raw, "pl_rade")
+    teff = ps._ingest_references(raw, "st_teff")
+    assert radius is period
+    assert list(period) == [
+        "Torres et al. 2008",
+        "Ivshina + Winn 2022",
+        "Torres et al. 2008",
+    ]
+    assert list(teff) == ["Calculated Value", "Calculated Value", ""]
+    del ps._parsed_references
+
+    # without a cache, each reference is still parsed correctly
+    assert list(ps._ingest_references(raw, "pl_rade")) == list(period)
+
+
+def test_with_individual_references(monkeypatch):
+    """
+    Does the `ps` table load in the background, without asking for input there?
+    """
+    module = sys.modules["exoatlas.populations.exoplanets.exoplanets"]
+    calls = []
+
+    def fake_ps(remake=False):
+        calls.append((remake, threading.current_thread()))
+        return ExoplanetsPS(standard=fake_table(["B b", "A b", "B b"]))
+
+    def fake_check(*args, **kwargs):
+        calls.append(("checked", threading.current_thread()))
+        return True
+
+    fake_ps._downloader = ExoplanetsPS._downloader
+    monkeypatch.setattr(module, "ExoplanetsPS", fake_ps)
+    monkeypatch.setattr(module, "check_if_needs_updating", fake_check)
+
+    e = Exoplanets(standard=fake_table(["A b", "B b"]), with_individual_references=True)
+    assert calls.pop()[0] == False
+    assert list(e["A b"].individual_references.name()) == ["A b"]
+
+    # any question about updating `ps` gets asked on the main thread first
+    Exoplanets(
+        standard=fake_table(["A b"]), remake=None, with_individual_references=True
+    )
+    assert calls[0] == ("checked", threading.main_thread())
+    assert calls[1][0] == True
+    assert calls[1][1] is not threading.main_thread()
+
+    # an error loading `pscomppars` doesn't wait for `ps` to finish
+    release = threading.Event()
+    monkeypatch.setattr(module, "ExoplanetsPS", lambda remake: release.wait(10))
+    start = time.time()
+    try:
+        with pytest.raises(AssertionError):
+            Exoplanets(standard="not a table", with_individual_references=True)
+        assert time.time() - start < 5
+    finally:
+        release.set()
@@ -1,3 +1,4 @@
+import pickle
 from .setup_tests import *
 
 from exoatlas.imports import *
@@ -28,6 +29,61 @@ def test_solarsystem():
         p()._validate_columns()
 
 
+def test_remade_calculations():
+    """
+    Do calculations work on a freshly ingested population?
+    """
+    p = SolarSystem(remake=True)
+    assert np.all(np.isfinite(p.eccentricity()))
+    assert type(p.eccentricity()) == type(p.eccentricity(distribution=True))
+    assert np.all(np.isfinite(p.argument_of_periastron()))
+    p.transit_impact_parameter()
+
+
+def test_standardized_binary_copy(tmp_path, monkeypatch):
+    """
+    Do we load the binary copy of a standardized table only when we should?
+    """
+    # (keep all the files for this test out of the real data directory)
+    text = str(tmp_path / "standardized-SolarSystem.txt")
+    monkeypatch.setattr(
+        SolarSystem, "_standardized_data_path", property(lambda self: text)
+    )
+    N = len(SolarSystem().standard)
+    p = SolarSystem()
+    binary = p._standardized_binary_path
+    assert os.path.exists(binary)
+
+    def write_binary(description, standard):
+        with open(binary, "wb") as f:
+            pickle.dump(dict(description=description, standard=standard), f)
+
+    # an up-to-date binary copy gets used (here, a deliberately shortened one)
+    write_binary(p._describe_standardized_data(), p.standard[:2])
+    assert len(SolarSystem().standard) == 2
+
+    # a binary copy that doesn't match the text table gets ignored, then replaced
+    write_binary(p._describe_standardized_data(), p.standard[:2])
+    os.utime(text, (0, 0))
+    assert len(SolarSystem().standard) == N
+    assert len(SolarSystem().standard) == N
+
+    # so does one made with different versions of libraries
+    write_binary(dict(p._describe_standardized_data(), numpy="0.0"), p.standard[:2])
+    assert len(SolarSystem().standard) == N
+
+    # so does one that isn't a table
+    write_binary(p._describe_standardized_data(), "not a table")
+    assert len(SolarSystem().standard) == N
+
+    # so does one that's corrupt, or can't be unpickled here
+    for contents in [b"not a pickle", b"cnot_a_real_module\nthing\n."]:
+        with open(binary, "wb") as f:
+            f.write(contents)
+        assert len(SolarSystem().standard) == N
+    assert len(SolarSystem().standard) == N
+
+
 def test_exoplanets():
     """
     Can we make a population of confirmed exoplanets?
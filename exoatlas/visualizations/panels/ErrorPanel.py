@@ -170,7 +170,7 @@ class ErrorPanel(BubblePanel):
                 & np.isfinite(weights)
             )
 
-            n_nouncertainty = sum(ok == False)
+            n_nouncertainty = np.count_nonzero(~ok)
             # self._speak(
             #    f"skipping {n_nouncertainty} planets that are missing data or uncertainties"
             # )
@@ -186,7 +186,7 @@ class ErrorPanel(BubblePanel):
             # not want to throw out values that might go
             # negative.
 
-            n_consistentwithzero = sum(ok == False) - n_nouncertainty
+            n_consistentwithzero = np.count_nonzero(~ok) - n_nouncertainty
             # self._speak(
             #    f"skipping {n_consistentwithzero} planets that are consistent with zero"
             # )
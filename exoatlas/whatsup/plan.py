@@ -100,7 +100,7 @@ class Plan(Talker):
         possible = zenith < 60.0 * u.deg
         self._speak(
             "{}/{} targets are visible from {} latitude".format(
-                np.sum(possible), len(possible), self.observatory.latitude
+                np.count_nonzero(possible), len(possible), self.observatory.latitude
             )
         )
 
@@ -114,12 +114,12 @@ class Plan(Talker):
         )
 
         # KLUDGE
-        bad_duration = np.isfinite(self.population.transit_duration()) == False
+        bad_duration = ~np.isfinite(self.population.transit_duration())
 
         # print('These planets have bad durations!')
         # print(self.population[bad_duration].name)
 
-        self.population = self.population[bad_duration == False]
+        self.population = self.population[~bad_duration]
         # add some colors to the population
         N = len(self.population)
         c = np.array(colors)[np.arange(N) % len(colors)]
@@ -143,7 +143,7 @@ class Plan(Talker):
         # ask which planets have transits happening tonight/today
         dt = now - pop.closest_epoch_day
         is_happening_tonight = np.abs(dt) < 0.5 * u.day
-        sum(is_happening_tonight), len(is_happening_tonight)
+        np.count_nonzero(is_happening_tonight), len(is_happening_tonight)
 
         # pull out only the times where a transit is happening within 0.5 days
         times_happening = Time(pop.closest_epoch_day[is_happening_tonight], format="jd")